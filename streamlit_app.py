@@ -49,6 +49,130 @@ st.title("🌊 밀려오는 파도, 밀려오는 불안")
 st.markdown("### 해수면 상승이 청소년 정신건강과 일상생활에 미치는 영향")
 st.caption("데이터 출처: 기획재정부, 해양수산부, 국립해양조사원")
 
+# ========================
+# 데이터 및 차트 생성 (캐시)
+# ========================
+# 중심 이동평균 — pandas rolling(window, center=True).mean()과 같은 결과
+# (창이 배열 양 끝을 벗어나는 위치는 NaN)
+def _rolling_mean_centered(x, window):
+    x = np.asarray(x, dtype=float)
+    out = np.full_like(x, np.nan)
+    if len(x) >= window:
+        half = window // 2
+        sums = np.convolve(x, np.ones(window), mode='valid')
+        out[half:half + len(x) - window + 1] = sums / window
+    return out
+
+
+@st.cache_data
+def load_sea_level_data():
+    sea_levels = [
+        0, 2, 4, 7, 9, 12, 14, 16, 19, 22,
+        24, 27, 30, 32, 35, 38, 41, 44, 47, 50,
+        53, 57, 60, 63, 67, 70, 74, 77, 81, 85,
+        89, 93, 97, 101, 105, 110
+    ]
+    sea_level_mm = np.asarray(sea_levels)
+    annual_rise = np.empty(len(sea_levels))
+    annual_rise[0] = np.nan
+    annual_rise[1:] = np.diff(sea_level_mm)
+    avg_5yr = _rolling_mean_centered(annual_rise, 5)
+    df = pd.DataFrame({
+        'year': np.arange(1989, 2025),
+        'sea_level_mm': sea_level_mm,
+        'sea_level_cm': sea_level_mm / 10,
+        'annual_rise': annual_rise,
+        '5yr_avg': avg_5yr
+    }, copy=False)
+    return df
+
+
+@st.cache_data
+def load_damage_data():
+    # 피해 지역 데이터 (기사 URL 포함)
+    damage_data = pd.DataFrame([
+        {"name":"대청도","lat":37.828,"lon":124.704,"severity":3,
+         "desc":"만조 시 도로·항구 침수 발생","impact":"어업 활동 제한, 주민 대피",
+         "url":"https://www.kyeonggi.com/article/20230803580166",
+         "color":[255,100,100,200]},
+        {"name":"연평도","lat":37.666,"lon":125.700,"severity":3,
+         "desc":"도서지역 만조 침수 피해","impact":"선박 운항 중단, 물자 보급 차질",
+         "url":"https://www.kyeongin.com/article/1747652",
+         "color":[255,100,100,200]},
+        {"name":"부산 해안","lat":35.1796,"lon":129.0756,"severity":2,
+         "desc":"저지대 주택·도로 침수","impact":"해운대, 광안리 일대 침수",
+         "url":"https://www.hankyung.com/article/2023030990747",
+         "color":[255,150,100,200]}
+    ]).astype({'severity': 'int8'})
+    # deck.gl이 행마다 식을 평가하지 않도록 좌표·반경을 열로 미리 계산
+    damage_data['position'] = damage_data[['lon', 'lat']].to_numpy().tolist()
+    damage_data['radius'] = damage_data['severity'].to_numpy(np.float32) * 15000.0
+    return damage_data
+
+
+# 그림 객체는 세션 간 공유되므로 반환 후 수정하지 않는다.
+# st.plotly_chart에는 Figure를 그대로 넘긴다: dict/JSON으로 넘기면 매번
+# go.Figure로 재검증되어 오히려 더 느리다.
+@st.cache_resource
+def build_sea_level_fig():
+    df = load_sea_level_data()
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=df['year'], y=df['sea_level_cm'],
+        mode='lines+markers', name='해수면 상승',
+        line=dict(color='#0066CC', width=3),
+        marker=dict(size=6, color='#1E90FF')
+    ))
+    fig.add_trace(go.Scatter(
+        x=df['year'], y=df['5yr_avg']/10,
+        mode='lines', name='5년 이동평균 상승률',
+        line=dict(color='#FF6B6B', width=2, dash='dash'),
+        yaxis='y2'
+    ))
+    fig.update_layout(
+        title='한국 연안 해수면 변화 추이',
+        xaxis_title='연도', yaxis_title='해수면 상승 (cm)',
+        yaxis2=dict(title='연간 상승률 (cm/년)', overlaying='y', side='right'),
+        height=500, hovermode='x unified', plot_bgcolor='white'
+    )
+    return fig
+
+
+# 마커 레이어는 보기(view)와 무관하므로 한 번만 만들어 모든 Deck이 공유
+@st.cache_resource
+def build_layers():
+    damage_data = load_damage_data()
+
+    # 레이어마다 필요한 열만 JSON으로 직렬화되도록 잘라서 전달
+    scatter_layer = pdk.Layer(
+        "ScatterplotLayer", id="damage-points",
+        data=damage_data[['position', 'color', 'radius', 'name', 'desc', 'impact']],
+        get_position='position', get_fill_color='color',
+        get_radius='radius', pickable=True
+    )
+    text_layer = pdk.Layer(
+        "TextLayer", id="damage-labels",
+        data=damage_data[['position', 'name']],
+        get_position='position', get_text='name', get_size=14,
+        get_color=[0,0,0,255], get_alignment_baseline="'bottom'"
+    )
+    return [scatter_layer, text_layer]
+
+
+@st.cache_resource
+def build_deck():
+    # 지도 기본 뷰
+    view_state = pdk.ViewState(latitude=36.0, longitude=128.0, zoom=6)
+
+    # ⭐ 지도 잘 보이게 map_style=None
+    return pdk.Deck(
+        layers=build_layers(),
+        initial_view_state=view_state,
+        map_style=None,
+        tooltip={"html": "<b>{name}</b><br/>{desc}<br/>{impact}"}
+    )
+
+
 # ========================
 # 탭 생성
 # ========================
@@ -65,24 +189,6 @@ tab1, tab2, tab3, tab4 = st.tabs([
 with tab1:
     st.header("📊 한국 연안 해수면 상승 추이 (1989-2024)")
 
-    @st.cache_data
-    def load_sea_level_data():
-        years = list(range(1989, 2025))
-        sea_levels = [
-            0, 2, 4, 7, 9, 12, 14, 16, 19, 22,
-            24, 27, 30, 32, 35, 38, 41, 44, 47, 50,
-            53, 57, 60, 63, 67, 70, 74, 77, 81, 85,
-            89, 93, 97, 101, 105, 110
-        ]
-        df = pd.DataFrame({
-            'year': years,
-            'sea_level_mm': sea_levels,
-            'sea_level_cm': [s/10 for s in sea_levels]
-        })
-        df['annual_rise'] = df['sea_level_mm'].diff()
-        df['5yr_avg'] = df['annual_rise'].rolling(window=5, center=True).mean()
-        return df
-
     df = load_sea_level_data()
 
     col1, col2, col3, col4 = st.columns(4)
@@ -99,26 +205,7 @@ with tab1:
     with col4:
         st.metric("2050년 예상", "~20 cm", "IPCC 예측")
 
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=df['year'], y=df['sea_level_cm'],
-        mode='lines+markers', name='해수면 상승',
-        line=dict(color='#0066CC', width=3),
-        marker=dict(size=6, color='#1E90FF')
-    ))
-    fig.add_trace(go.Scatter(
-        x=df['year'], y=df['5yr_avg']/10,
-        mode='lines', name='5년 이동평균 상승률',
-        line=dict(color='#FF6B6B', width=2, dash='dash'),
-        yaxis='y2'
-    ))
-    fig.update_layout(
-        title='한국 연안 해수면 변화 추이',
-        xaxis_title='연도', yaxis_title='해수면 상승 (cm)',
-        yaxis2=dict(title='연간 상승률 (cm/년)', overlaying='y', side='right'),
-        height=500, hovermode='x unified', plot_bgcolor='white'
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_sea_level_fig(), use_container_width=True)
 
 # ========================
 # TAB 2: 피해 지역 지도
@@ -126,55 +213,20 @@ with tab1:
 with tab2:
     st.header("🗺️ 해수면 상승 피해 지역 현황")
 
-    # 피해 지역 데이터 (기사 URL 포함)
-    damage_data = pd.DataFrame([
-        {"name":"대청도","lat":37.828,"lon":124.704,"severity":3,
-         "desc":"만조 시 도로·항구 침수 발생","impact":"어업 활동 제한, 주민 대피",
-         "url":"https://www.kyeonggi.com/article/20230803580166",
-         "color":[255,100,100,200]},
-        {"name":"연평도","lat":37.666,"lon":125.700,"severity":3,
-         "desc":"도서지역 만조 침수 피해","impact":"선박 운항 중단, 물자 보급 차질",
-         "url":"https://www.kyeongin.com/article/1747652",
-         "color":[255,100,100,200]},
-        {"name":"부산 해안","lat":35.1796,"lon":129.0756,"severity":2,
-         "desc":"저지대 주택·도로 침수","impact":"해운대, 광안리 일대 침수",
-         "url":"https://www.hankyung.com/article/2023030990747",
-         "color":[255,150,100,200]}
-    ])
-
-    # 지도 기본 뷰
-    view_state = pdk.ViewState(latitude=36.0, longitude=128.0, zoom=6)
-
-    scatter_layer = pdk.Layer(
-        "ScatterplotLayer", data=damage_data,
-        get_position='[lon, lat]', get_color='color',
-        get_radius='severity * 15000', pickable=True
-    )
-    text_layer = pdk.Layer(
-        "TextLayer", data=damage_data,
-        get_position='[lon, lat]', get_text='name', get_size=14,
-        get_color=[0,0,0,255], get_alignment_baseline="'bottom'"
-    )
-
-    # ⭐ 지도 잘 보이게 map_style=None
-    r = pdk.Deck(
-        layers=[scatter_layer, text_layer],
-        initial_view_state=view_state,
-        map_style=None,
-        tooltip={"html": "<b>{name}</b><br/>{desc}<br/>{impact}"}
-    )
-    st.pydeck_chart(r)
+    damage_data = load_damage_data()
+    st.pydeck_chart(build_deck())
 
     # 피해 지역 상세 정보 + 기사 링크 (토글)
     st.markdown("### 📋 피해 지역 상세 정보")
-    for idx, row in damage_data.iterrows():
-        severity_emoji = ["", "🟡", "🟠", "🔴"][row['severity']]
-        with st.expander(f"{severity_emoji} {row['name']} - {row['desc']}"):
-            st.markdown(f"**위치:** {row['lat']:.3f}°N, {row['lon']:.3f}°E")
-            st.markdown(f"**피해 정도:** {'★' * row['severity']}")
-            st.markdown(f"**주요 영향:** {row['impact']}")
-            if row['url']:
-                st.markdown(f"[📰 관련 기사 보기]({row['url']})")
+    for row in damage_data.itertuples(index=False):
+        severity_emoji = ["", "🟡", "🟠", "🔴"][row.severity]
+        body = (f"**위치:** {row.lat:.3f}°N, {row.lon:.3f}°E  \n"
+                f"**피해 정도:** {'★' * row.severity}  \n"
+                f"**주요 영향:** {row.impact}")
+        if row.url:
+            body += f"  \n[📰 관련 기사 보기]({row.url})"
+        with st.expander(f"{severity_emoji} {row.name} - {row.desc}"):
+            st.markdown(body)
 
 # ========================
 # TAB 3, TAB 4, 사이드바 (이전 코드 유지)